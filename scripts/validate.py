@@ -9,8 +9,11 @@ import json
 import yaml
 import argparse
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from datetime import datetime
+from collections import defaultdict
+
+from generate_registry import parse_size_to_gb
 
 try:
     import jsonschema
@@ -44,24 +47,135 @@ def validate_preset(preset: Dict[str, Any], schema: Dict[str, Any]) -> List[str]
     except ValidationError as e:
         errors.append(f"Schema validation: {e.message}")
 
-    # Additional validations
-    if 'files' in preset:
+    # Additional validations (malformed shapes are left to the schema error above)
+    if isinstance(preset, dict) and isinstance(preset.get('files'), list):
         for i, file in enumerate(preset['files']):
-            if 'url' in file and 'huggingface.co' in file['url']:
-                if 'source' not in file or 'revision' not in file.get('source', {}):
+            if not isinstance(file, dict):
+                continue
+            if isinstance(file.get('url'), str) and 'huggingface.co' in file['url']:
+                source = file.get('source')
+                if not isinstance(source, dict) or 'revision' not in source:
                     errors.append(f"File {i}: HuggingFace URLs should have revision pinning")
 
     return errors
 
 
+def build_catalog_index(presets: List[Tuple[Path, Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+    """Index all presets in a single pass: path -> urls, url -> revisions, id -> locations"""
+    index = {
+        "path_urls": defaultdict(lambda: defaultdict(list)),
+        "url_revisions": defaultdict(lambda: defaultdict(list)),
+        "id_locations": defaultdict(list),
+    }
+
+    # Skip malformed entries here; schema validation reports them
+    for preset_file, preset in presets:
+        if not isinstance(preset, dict):
+            continue
+
+        preset_id = preset.get("id")
+        if preset_id:
+            index["id_locations"][preset_id].append(preset_file)
+
+        files = preset.get("files")
+        if not isinstance(files, list):
+            continue
+
+        for file in files:
+            if not isinstance(file, dict):
+                continue
+
+            path = file.get("path")
+            url = file.get("url")
+            if path and url:
+                index["path_urls"][path][url].append(preset_file)
+
+            source = file.get("source")
+            revision = source.get("revision") if isinstance(source, dict) else None
+            if url and revision:
+                index["url_revisions"][url][revision].append(preset_file)
+
+    return index
+
+
+def lint_catalog(presets: List[Tuple[Path, Dict[str, Any]]], size_tolerance: float = 0.05) -> List[str]:
+    """Check catalog-wide consistency across presets, return list of errors"""
+    errors = []
+    index = build_catalog_index(presets)
+
+    for preset_id, locations in index["id_locations"].items():
+        if len(locations) > 1:
+            paths = ", ".join(str(p) for p in locations)
+            errors.append(f"Duplicate id '{preset_id}': {paths}")
+
+    for path, urls in index["path_urls"].items():
+        if len(urls) > 1:
+            details = "".join(
+                f"\n      {url} ({', '.join(str(p) for p in locations)})"
+                for url, locations in urls.items()
+            )
+            errors.append(f"Path '{path}' maps to {len(urls)} different URLs:{details}")
+
+    for url, revisions in index["url_revisions"].items():
+        if len(revisions) > 1:
+            details = "".join(
+                f"\n      {revision} ({', '.join(str(p) for p in locations)})"
+                for revision, locations in revisions.items()
+            )
+            errors.append(f"URL '{url}' pinned to {len(revisions)} different revisions:{details}")
+
+    # Declared download_size should match the sum of its file sizes
+    for preset_file, preset in presets:
+        if not isinstance(preset, dict) or "download_size" not in preset:
+            continue
+
+        sizes = [("download_size", preset["download_size"])]
+        files = preset.get("files")
+        if isinstance(files, list):
+            sizes += [
+                (f"files[{i}].size", f.get("size", "0GB"))
+                for i, f in enumerate(files) if isinstance(f, dict)
+            ]
+
+        parsed = []
+        for field, value in sizes:
+            try:
+                parsed.append(parse_size_to_gb(value))
+            except (AttributeError, ValueError):
+                errors.append(f"{preset_file}: cannot parse {field} {value!r}")
+        if len(parsed) != len(sizes):
+            continue
+
+        declared, total = parsed[0], sum(parsed[1:])
+        if abs(declared - total) > max(size_tolerance * total, 0.01):
+            errors.append(
+                f"{preset_file}: download_size {preset['download_size']} "
+                f"does not match sum of file sizes ({total:.2f}GB)"
+            )
+
+    return errors
+
+
 def main():
     parser = argparse.ArgumentParser(description="Validate preset YAML files")
     parser.add_argument("--preset", type=Path, help="Validate specific preset file")
     parser.add_argument("--all", action="store_true", help="Validate all presets")
+    parser.add_argument("--lint", action="store_true", help="Also check cross-preset consistency (requires --all)")
+    parser.add_argument("--lint-only", action="store_true",
+                        help="Only check cross-preset consistency across all presets (skip schema validation)")
+    parser.add_argument("--size-tolerance", type=float, default=0.05,
+                        help="Allowed relative difference between download_size and sum of file sizes")
     parser.add_argument("--schema", type=Path, default=Path("schema.yaml"), help="Schema file path")
     parser.add_argument("--presets-dir", type=Path, default=Path("presets"), help="Presets directory")
     args = parser.parse_args()
 
+    if args.lint and not args.all:
+        parser.error("--lint requires --all")
+    if args.lint_only:
+        if args.preset:
+            parser.error("--lint-only cannot be combined with --preset")
+        args.all = args.lint = True
+
     # Load schema
     if not args.schema.exists():
         print(f"ERROR: Schema file not found: {args.schema}")
@@ -93,6 +207,7 @@ def main():
 
     elif args.all:
         # Validate all presets
+        catalog = []
         for category_dir in args.presets_dir.iterdir():
             if not category_dir.is_dir():
                 continue
@@ -107,6 +222,10 @@ def main():
                     continue
 
                 preset = load_preset(preset_file)
+                catalog.append((preset_file, preset))
+                if args.lint_only:
+                    continue
+
                 errors = validate_preset(preset, schema)
 
                 if errors:
@@ -117,7 +236,17 @@ def main():
                 else:
                     presets_validated += 1
 
-        print(f"\nValidated {presets_validated} presets, {errors_found} errors")
+        if not args.lint_only:
+            print(f"\nValidated {presets_validated} presets, {errors_found} errors")
+
+        if args.lint:
+            lint_errors = lint_catalog(catalog, args.size_tolerance)
+            if lint_errors:
+                print("\nCatalog consistency:")
+                for error in lint_errors:
+                    print(f"  - {error}")
+                errors_found += 1
+            print(f"\nLinted {len(catalog)} presets, {len(lint_errors)} catalog issues")
 
     else:
         parser.print_help()